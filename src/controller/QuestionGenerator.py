@@ -1,88 +1,118 @@
-import ollama, json, math
+import ollama, json, itertools
+from collections import Counter
 from models.quiz import Question, Quiz
+from models.enums import QuestionTypeEnum
 from stores.llm.templates.template_parser import TemplateParser
 from helpers.config import get_settings
+from helpers.distribution import type_counts
+
+# spellings the model uses for each type, so off-label outputs are not wasted
+_TYPE_ALIASES = {
+    "mcq": QuestionTypeEnum.MCQ.value,
+    "multiple choice": QuestionTypeEnum.MCQ.value,
+    "multiplechoice": QuestionTypeEnum.MCQ.value,
+    "truefalse": QuestionTypeEnum.TRUEFALSE.value,
+    "true/false": QuestionTypeEnum.TRUEFALSE.value,
+    "true_false": QuestionTypeEnum.TRUEFALSE.value,
+    "tf": QuestionTypeEnum.TRUEFALSE.value,
+    "written": QuestionTypeEnum.WRITTEN.value,
+    "اختيار من متعدد": QuestionTypeEnum.MCQ.value,
+    "اختيارات متعددة": QuestionTypeEnum.MCQ.value,
+    "صح/خطأ": QuestionTypeEnum.TRUEFALSE.value,
+    "صح أو خطأ": QuestionTypeEnum.TRUEFALSE.value,
+    "كتابي": QuestionTypeEnum.WRITTEN.value,
+    "مقالية": QuestionTypeEnum.WRITTEN.value,
+    "إجابة كتابية": QuestionTypeEnum.WRITTEN.value,
+}
+
+
+def _normalize_type(qtype):
+    if not isinstance(qtype, str):
+        return qtype
+    return _TYPE_ALIASES.get(qtype.strip().lower(), qtype)
 
 
 class QuestionGenerator:
-    def __init__(self, model: str = None, language: str = "en"):
+    def __init__(self, model: str = None, language: str = "en", max_followups: int = 2):
         settings = get_settings()
         self.model = model or settings.QUIZ_GENERATION_MODEL
-        self.template_parser = TemplateParser(language)
-
+        self.template_parser = TemplateParser(language, compact=settings.COMPACT_PROMPTS)
+        self.max_followups = max_followups
 
     def generate(self, level: str, text_chunks: list, n_questions: int,
                  mcq_ratio: float = 0.6, tf_ratio: float = 0.2,
                  written_ratio: float = 0.2):
-        
-        n_mcq = math.ceil(n_questions * mcq_ratio)
-        n_tf = math.ceil(n_questions * tf_ratio)
-        n_written = math.ceil(n_questions * written_ratio)
-        total_q = n_mcq + n_tf + n_written
+
+        targets = type_counts(n_questions, mcq_ratio, tf_ratio, written_ratio)
 
         all_questions = []
+        if not text_chunks or not sum(targets.values()):
+            return Quiz(all_questions)
+
         for page in text_chunks:
             print(f"page content >>>>>>>>>{page}")
-            prompt = self.template_parser.get(
-                "prompt", "quiz_prompt",
-                {
-                    "level": level,
-                    "text": page,
-                    "total_q": total_q,
-                    "n_mcq": n_mcq,
-                    "n_tf": n_tf,
-                    "n_written": n_written
-                }
-            )
+            all_questions += self._generate_page(level, page, targets)
 
-            response = ollama.chat(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": f"""
-                        You are a structured quiz generator.
-                        RULES:
-                            1. You must generate EXACTLY {total_q} questions in total.
-                            2. The distribution must be EXACTLY:
-                            - {n_mcq} Multiple Choice Questions (MCQ)
-                            - {n_tf} True/False Questions
-                            - {n_written} Written Questions
-                            3. Difficulty Level: {level}
-                            4. Each question must strictly follow the JSON format provided.
-                            5. Do not add explanations, notes, or greetings.
-                            6. Do not skip or add fields in the JSON structure.
-                            7. Every question MUST include a non-empty "answer" field:
-                            - For MCQ: the correct option must be specified in "answer".
-                            - For True/False: "answer" must be either "True" or "False".
-                            - For Written: "answer" must contain a clear reference solution.
-                            8. If you cannot follow the format, output exactly: ERROR: FORMAT VIOLATION.
-                            9. If the number of questions, their distribution, or the presence of answers does not match the requirement, output exactly: ERROR: QUESTION COUNT VIOLATION.
-                            10. Only output valid JSON. If invalid, output exactly: ERROR: JSON PARSE.
-                            11. Do not add any id field
-                    """},
-                    {"role": "user", "content": prompt}
-                ],
-                format="json"
-            )
-            result = response['message']['content']
-
-            if result.startswith("ERROR"):
-                print(f"[ERROR from model] {result}")
-                continue
-
-            try:
-                quiz_json = json.loads(result)
-            except json.JSONDecodeError:
-                print(f"[ERROR] Invalid JSON from model: {result}")
-                continue
-
-            for item in quiz_json.get("quiz", []):
-                all_questions.append(
-                    Question(
-                        item.get("type"),
-                        item.get("question"),
-                        item.get("options", []),
-                        item.get("answer", "")
-                    )
-                )
+        # follow-up generation only for the types that came back short
+        pages = itertools.cycle(text_chunks)
+        for _ in range(self.max_followups):
+            generated = Counter(q.type for q in all_questions)
+            short = {t: target - generated[t] for t, target in targets.items() if generated[t] < target}
+            if not short:
+                break
+            for qtype, missing in short.items():
+                counts = {t: 0 for t in targets}
+                counts[qtype] = missing
+                all_questions += self._generate_page(level, next(pages), counts)
 
         return Quiz(all_questions)
+
+    def _generate_page(self, level: str, page: str, counts: dict):
+        n_mcq = counts[QuestionTypeEnum.MCQ.value]
+        n_tf = counts[QuestionTypeEnum.TRUEFALSE.value]
+        n_written = counts[QuestionTypeEnum.WRITTEN.value]
+        total_q = n_mcq + n_tf + n_written
+
+        template_vars = {
+            "level": level,
+            "text": page,
+            "total_q": total_q,
+            "n_mcq": n_mcq,
+            "n_tf": n_tf,
+            "n_written": n_written
+        }
+        system_prompt = self.template_parser.get("prompt", "system_prompt", template_vars)
+        prompt = self.template_parser.get("prompt", "quiz_prompt", template_vars)
+
+        response = ollama.chat(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            format="json"
+        )
+        result = response['message']['content']
+
+        if result.startswith("ERROR"):
+            print(f"[ERROR from model] {result}")
+            return []
+
+        try:
+            quiz_json = json.loads(result)
+        except json.JSONDecodeError:
+            print(f"[ERROR] Invalid JSON from model: {result}")
+            return []
+
+        questions = []
+        for item in quiz_json.get("quiz", []):
+            questions.append(
+                Question(
+                    _normalize_type(item.get("type")),
+                    item.get("question"),
+                    item.get("options", []),
+                    item.get("answer", "")
+                )
+            )
+
+        return questions
@@ -1,14 +1,24 @@
 from sentence_transformers import SentenceTransformer, util
 from helpers.config import get_settings
 import numpy as np
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _load_embedding_model(name: str):
+    # loaded once per model name and reused across requests
+    return SentenceTransformer(name)
+
 
 class QuestionSelector:
     def __init__(self, model: str = None):
         settings = get_settings()
         self.model = model or settings.EMBEDDING_MODEL
-        self.embedding_model = SentenceTransformer(self.model)
+        self.embedding_model = _load_embedding_model(self.model)
 
     def select_diverse(self, questions, k: int):
+        if k <= 0:
+            return []
         if k >= len(questions):
             return questions
         
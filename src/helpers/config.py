@@ -3,8 +3,15 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class Settings(BaseSettings):
     QUIZ_GENERATION_MODEL: str
     EMBEDDING_MODEL: str
+    COMPACT_PROMPTS: bool = False
     model_config = SettingsConfigDict(env_file=".env")
 
 
+class FeedbackSettings(BaseSettings):
+    # the feedback API runs from the repo root, so also look in src/
+    COMPACT_PROMPTS: bool = False
+    model_config = SettingsConfigDict(env_file=(".env", "src/.env"), extra="ignore")
+
+
 def get_settings():
     return Settings() 
\ No newline at end of file
@@ -0,0 +1,33 @@
+import math
+from models.enums import QuestionTypeEnum
+
+
+def allocate_counts(n: int, ratios: dict) -> dict:
+    """Split n into integer counts proportional to ratios (largest remainder).
+
+    The counts always sum to exactly n (0 if every ratio is 0); ties go to
+    the key that comes first in ratios.
+    """
+    n = n or 0
+    weights = {key: max(ratio or 0, 0) for key, ratio in ratios.items()}
+    total = sum(weights.values())
+    if n <= 0 or total <= 0:
+        return {key: 0 for key in weights}
+
+    quotas = {key: n * w / total for key, w in weights.items()}
+    counts = {key: math.floor(q) for key, q in quotas.items()}
+
+    leftover = n - sum(counts.values())
+    by_remainder = sorted(weights, key=lambda key: quotas[key] - counts[key], reverse=True)
+    for key in by_remainder[:leftover]:
+        counts[key] += 1
+
+    return counts
+
+
+def type_counts(n: int, mcq_ratio: float, tf_ratio: float, written_ratio: float) -> dict:
+    return allocate_counts(n, {
+        QuestionTypeEnum.MCQ.value: mcq_ratio,
+        QuestionTypeEnum.TRUEFALSE.value: tf_ratio,
+        QuestionTypeEnum.WRITTEN.value: written_ratio,
+    })
@@ -0,0 +1,84 @@
+"""Measure the quiz generation messages per locale, verbose vs compact template.
+
+Reports the system message, the user prompt and their total, i.e. the full
+message list QuestionGenerator sends for one page.
+
+Run from src/:
+    python -m helpers.prompt_size
+    python -m helpers.prompt_size --pdf "data/The Machine Learning Pipeline.pdf" --page 1
+    python -m helpers.prompt_size --tokenizer <hf-tokenizer-name>
+    python -m helpers.prompt_size --ollama gemma3:4b
+
+Without --pdf the page text is empty, so only the template overhead is measured.
+"""
+import argparse
+import os
+
+from stores.llm.templates.template_parser import TemplateParser
+
+
+def render(language: str, compact: bool, text: str = "", level: str = "medium",
+           n_mcq: int = 3, n_tf: int = 1, n_written: int = 1) -> list:
+    parser = TemplateParser(language, compact=compact)
+    template_vars = {
+        "level": level,
+        "text": text,
+        "total_q": n_mcq + n_tf + n_written,
+        "n_mcq": n_mcq,
+        "n_tf": n_tf,
+        "n_written": n_written,
+    }
+    return [
+        {"role": "system", "content": parser.get("prompt", "system_prompt", template_vars)},
+        {"role": "user", "content": parser.get("prompt", "quiz_prompt", template_vars)},
+    ]
+
+
+def count_tokens(messages: list, tokenizer=None, ollama_model: str = None):
+    if ollama_model:
+        import ollama
+        response = ollama.chat(model=ollama_model, messages=messages, options={"num_predict": 1})
+        return response.get("prompt_eval_count")
+    if tokenizer is not None:
+        return sum(len(tokenizer.encode(m["content"], add_special_tokens=False)) for m in messages)
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdf", help="PDF to take the page text from")
+    parser.add_argument("--page", type=int, default=1, help="1-based page number in --pdf")
+    parser.add_argument("--tokenizer", help="HuggingFace tokenizer name (needs transformers)")
+    parser.add_argument("--ollama", help="Ollama model; reports its real prompt_eval_count")
+    args = parser.parse_args()
+
+    text = ""
+    if args.pdf:
+        from controller import PDFReader
+        pages = dict(PDFReader(args.pdf).extract_text_in_pages())
+        text = pages.get(args.page, "")
+
+    tokenizer = None
+    if args.tokenizer:
+        from transformers import AutoTokenizer
+        tokenizer = AutoTokenizer.from_pretrained(args.tokenizer)
+
+    locales_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "stores", "llm", "templates", "locales")
+    languages = sorted(d for d in os.listdir(locales_path)
+                       if os.path.isdir(os.path.join(locales_path, d)) and not d.startswith("_"))
+
+    print(f"{'locale':<8}{'template':<10}{'message':<8}{'chars':>8}{'words':>8}{'tokens':>8}")
+    for language in languages:
+        for compact in (False, True):
+            messages = render(language, compact, text=text)
+            rows = [(m["role"], m["content"], count_tokens([m], tokenizer)) for m in messages]
+            total = "\n".join(m["content"] for m in messages)
+            rows.append(("total", total, count_tokens(messages, tokenizer, args.ollama)))
+            for name, content, tokens in rows:
+                print(f"{language:<8}{'compact' if compact else 'verbose':<10}{name:<8}"
+                      f"{len(content):>8}{len(content.split()):>8}{tokens if tokens is not None else '-':>8}")
+
+
+if __name__ == "__main__":
+    main()
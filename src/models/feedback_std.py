@@ -2,8 +2,14 @@ import json
 import re
 from langchain_ollama import OllamaLLM
 from langchain.prompts import ChatPromptTemplate
+from src.helpers.single_flight import SingleFlight, make_key
+from src.helpers.config import FeedbackSettings
 
 llm = OllamaLLM(model="gemma3:4b", temperature=0.7)
+COMPACT_PROMPTS = FeedbackSettings().COMPACT_PROMPTS
+
+# identical feedback items (e.g. retried submissions) share one in-flight LLM call
+_inflight = SingleFlight()
 
 
 _AR_CHARS = re.compile(r"[\u0600-\u06FF]")
@@ -43,6 +49,14 @@ AR_RULES = """- إذا كانت الإجابة صحيحة بالكامل (صح/
   - weak_points = [الموضوعات المذكورة]
   - advice = الإجراء العملي المذكور"""
 
+# Compact Arabic rules: English instructions, Arabic sentence openers kept verbatim
+AR_RULES_COMPACT = """- Fully correct (TF/MCQ=1 or Written=3): feedback = one short praise sentence (≤ 14 words) on the concept; praise_points = [concept]; weak_points = []; advice = "".
+- Otherwise: feedback = exactly 3 sentences:
+  1. the lead-in verbatim;
+  2. starts "لكن نقاط الضعف التي ينبغي التركيز عليها هي ..." + 1–2 short topics (≤ 12 words);
+  3. starts "أنصحك أن تتدرّب على ..." + one short action (≤ 12 words).
+  praise_points = []; weak_points = [those topics]; advice = that action."""
+
 
 prompt_template = ChatPromptTemplate.from_template("""
 You are a strict but supportive tutor.
@@ -76,11 +90,32 @@ def grade_answer(
     qtype: str = "written",
     given_score: float | None = None,
     lead_in: str = "",
+):
+    params = dict(
+        question=question,
+        student_answer=student_answer,
+        correct_answer=correct_answer,
+        qtype=qtype,
+        given_score=given_score,
+        lead_in=lead_in,
+        compact=COMPACT_PROMPTS,
+    )
+    return _inflight.do(make_key("grade_answer", **params), _grade_answer, **params)
+
+
+def _grade_answer(
+    question: str,
+    student_answer: str,
+    correct_answer: str,
+    qtype: str = "written",
+    given_score: float | None = None,
+    lead_in: str = "",
+    compact: bool = False,
 ):
     # Decide language by detecting Arabic characters
     if is_arabic(question) or is_arabic(student_answer) or is_arabic(correct_answer):
         lang = "Arabic"
-        rules = AR_RULES
+        rules = AR_RULES_COMPACT if compact else AR_RULES
     else:
         lang = "English"
         rules = EN_RULES
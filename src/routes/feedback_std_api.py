@@ -29,7 +29,7 @@ def health():
     return {"status": "ok"}
 
 @app.post("/feedback")
-async def feedback(answers: List[QuizAnswer]):
+def feedback(answers: List[QuizAnswer]):
     results: List[Dict] = []
     weak_pool: List[str] = []
     positive_pool: List[str] = []
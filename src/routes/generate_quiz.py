@@ -1,6 +1,6 @@
 from fastapi import FastAPI , APIRouter
 from .schema import QuizRequest
-from stores.llm.quiz_service import QuizService
+from stores.llm.quiz_service import generate_quiz
 
 generate_router = APIRouter(
     prefix = "/ai/generate_quiz",
@@ -9,9 +9,10 @@ generate_router = APIRouter(
 
 
 @generate_router.post("/")
-async def generate_quizes(request : QuizRequest):
-    service = QuizService(pdf_path=request.pdf_path, language=request.language)
-    quiz = service.generate_quiz(
+def generate_quizes(request : QuizRequest):
+    quiz = generate_quiz(
+        pdf_path=request.pdf_path,
+        language=request.language,
         level=request.level,
         n_questions=request.n_questions,
         focus_pages=request.focus_pages,
@@ -4,6 +4,11 @@ from controller import QuestionSelector
 from models.enums import QuestionTypeEnum
 from typing import List, Optional
 from helpers.config import get_settings
+from helpers.single_flight import SingleFlight, make_key
+from helpers.distribution import type_counts
+
+# identical in-flight requests share one QuizService build and generation
+_inflight = SingleFlight()
 
 class QuizService:
     def __init__(self, pdf_path: str, model: Optional[str] = None, language: str = "en"):
@@ -15,14 +20,14 @@ class QuizService:
         self.selector = QuestionSelector()
 
     
-    def _select_and_merge(self, focus_quiz, remain_quiz, q_type, n_focus, n_remain, f_ratio, r_ratio):
+    def _select_and_merge(self, focus_quiz, remain_quiz, q_type, focus_counts, remain_counts):
         focus_selected = self.selector.select_diverse(
             questions=focus_quiz.filter_by_type(q_type),
-            k=int(n_focus * f_ratio)
+            k=focus_counts[q_type]
         )
         remain_selected = self.selector.select_diverse(
             questions=remain_quiz.filter_by_type(q_type),
-            k=int(n_remain * r_ratio)
+            k=remain_counts[q_type]
         )
 
         final = focus_selected + remain_selected
@@ -46,20 +51,21 @@ class QuizService:
                 n_questions=n_questions,
                 mcq_ratio=f_mcq_ratio, tf_ratio=f_tf_ratio, written_ratio=f_written_ratio
             )
+            counts = type_counts(n_questions, f_mcq_ratio, f_tf_ratio, f_written_ratio)
 
             Final_MCQ = self.selector.select_diverse(
                 questions=quiz.filter_by_type(QuestionTypeEnum.MCQ.value),
-                k=int(n_questions * f_mcq_ratio)
+                k=counts[QuestionTypeEnum.MCQ.value]
             )
 
             Final_T_F = self.selector.select_diverse(
                 questions=quiz.filter_by_type(QuestionTypeEnum.TRUEFALSE.value),
-                k=int(n_questions * f_tf_ratio)
+                k=counts[QuestionTypeEnum.TRUEFALSE.value]
             )
 
             Final_Written = self.selector.select_diverse(
                 questions=quiz.filter_by_type(QuestionTypeEnum.WRITTEN.value),
-                k=int(n_questions * f_written_ratio)
+                k=counts[QuestionTypeEnum.WRITTEN.value]
             )
 
 
@@ -81,27 +87,38 @@ class QuizService:
             mcq_ratio=r_mcq_ratio, tf_ratio=r_tf_ratio, written_ratio=r_written_ratio
         )
 
+        focus_counts = type_counts(n_focus, f_mcq_ratio, f_tf_ratio, f_written_ratio)
+        remain_counts = type_counts(n_remain, r_mcq_ratio, r_tf_ratio, r_written_ratio)
+
         Final_MCQ = self._select_and_merge(
             focus_quiz=focus_quiz, remain_quiz=remain_quiz, 
             q_type=QuestionTypeEnum.MCQ.value, 
-            n_focus=n_focus, n_remain=n_remain, 
-            f_ratio=f_mcq_ratio, r_ratio=r_mcq_ratio
+            focus_counts=focus_counts, remain_counts=remain_counts
         )
         
         Final_T_F = self._select_and_merge(
             focus_quiz=focus_quiz, remain_quiz=remain_quiz, 
             q_type=QuestionTypeEnum.TRUEFALSE.value, 
-            n_focus=n_focus, n_remain=n_remain,
-            f_ratio=f_tf_ratio, r_ratio=r_tf_ratio
+            focus_counts=focus_counts, remain_counts=remain_counts
         )
 
         Final_Written = self._select_and_merge(
             focus_quiz=focus_quiz, remain_quiz=remain_quiz, 
             q_type=QuestionTypeEnum.WRITTEN.value, 
-            n_focus=n_focus, n_remain=n_remain, 
-            f_ratio=f_written_ratio, r_ratio=r_written_ratio
+            focus_counts=focus_counts, remain_counts=remain_counts
         )
 
         final_questions = [q.to_dict() for q in Final_MCQ] + [q.to_dict() for q in Final_T_F] + [q.to_dict() for q in Final_Written]
         return final_questions
 
+
+def generate_quiz(pdf_path: str, language: str = "en", model: Optional[str] = None, **params):
+    # coalesce before building the service so followers don't load the PDF or models either
+    model_name = model or get_settings().QUIZ_GENERATION_MODEL
+    key = make_key("generate_quiz", pdf_path=pdf_path, model=model_name, language=language, **params)
+    return _inflight.do(key, _generate_quiz, pdf_path, model_name, language, params)
+
+
+def _generate_quiz(pdf_path: str, model: str, language: str, params: dict):
+    service = QuizService(pdf_path=pdf_path, model=model, language=language)
+    return service.generate_quiz(**params)
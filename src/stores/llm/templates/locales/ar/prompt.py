@@ -42,3 +42,26 @@ quiz_prompt = Template(
     ---
     """
 )
+
+# Compact variants: short English instructions (Arabic costs far more tokens per word),
+# same output JSON, quiz content still in Arabic. The rules live only in the system
+# message; the user prompt carries the format and the text.
+system_prompt_compact = Template(
+"""You are a structured quiz generator. Rules:
+1. Generate EXACTLY ${total_q} questions: ${n_mcq} MCQ, ${n_tf} TrueFalse, ${n_written} Written. Difficulty: ${level}, reflected in how complex questions and answers are.
+2. Every question needs a non-empty "answer": MCQ = exactly one of its 4 options; TrueFalse = exactly "True" or "False"; Written = a 1-3 sentence reference answer.
+3. Output ONLY valid JSON in the given format, with no extra text, fields or ids.
+4. If you cannot comply, output exactly: ERROR: FORMAT VIOLATION."""
+)
+
+quiz_prompt_compact = Template(
+"""Write questions, options and Written answers in Arabic.
+Format:
+{"quiz": [{"type": "MCQ" | "TrueFalse" | "Written", "question": "...", "options": ["...", "...", "...", "..."], "answer": "..."}]}
+"options" is for MCQ only, without A/B/C/D.
+Text:
+---
+${text}
+---
+"""
+)
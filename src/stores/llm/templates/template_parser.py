@@ -1,10 +1,12 @@
 import os
 
 class TemplateParser:
-    def __init__(self, language: str=None, default_language='en'):
+    def __init__(self, language: str=None, default_language='en', compact: bool=False):
         self.current_path = os.path.dirname(os.path.abspath(__file__))
         self.default_language = default_language
         self.language = None
+        # prefer "<key>_compact" templates when the locale defines them
+        self.compact = compact
 
         self.set_language(language)
     
@@ -21,20 +23,30 @@ class TemplateParser:
     def get(self, group: str, key: str, vars: dict={}):
         if not group or not key:
             return None
-        
-        group_path = os.path.join(self.current_path, "locales", self.language, f"{group}.py" )
-        targeted_language = self.language
-        if not os.path.exists(group_path):
-            group_path = os.path.join(self.current_path, "locales", self.default_language, f"{group}.py" )
-            targeted_language = self.default_language
 
+        # keys missing from the current locale fall back to the default one
+        key_attribute = self._lookup(self.language, group, key)
+        if key_attribute is None and self.language != self.default_language:
+            key_attribute = self._lookup(self.default_language, group, key)
+
+        if key_attribute is None:
+            raise KeyError(f"template '{group}.{key}' not found for language '{self.language}'")
+
+        return key_attribute.substitute(vars)
+
+    def _lookup(self, language: str, group: str, key: str):
+        group_path = os.path.join(self.current_path, "locales", language, f"{group}.py" )
         if not os.path.exists(group_path):
             return None
-        
-        module = __import__(f"stores.llm.templates.locales.{targeted_language}.{group}", fromlist=[group])
+
+        module = __import__(f"stores.llm.templates.locales.{language}.{group}", fromlist=[group])
 
         if not module:
             return None
-        
-        key_attribute = getattr(module, key)
-        return key_attribute.substitute(vars)
\ No newline at end of file
+
+        key_attribute = None
+        if self.compact:
+            key_attribute = getattr(module, f"{key}_compact", None)
+        if key_attribute is None:
+            key_attribute = getattr(module, key, None)
+        return key_attribute
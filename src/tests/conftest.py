@@ -0,0 +1,71 @@
+import sys
+import threading
+import time
+
+import pytest
+
+
+class _CountingEvent(threading.Event):
+    def __init__(self):
+        super().__init__()
+        self.waiting = 0
+        self._count_lock = threading.Lock()
+
+    def wait(self, timeout=None):
+        with self._count_lock:
+            self.waiting += 1
+        return super().wait(timeout)
+
+
+class _CountingCall:
+    def __init__(self):
+        self.done = _CountingEvent()
+        self.result = None
+        self.error = None
+
+
+def _wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out waiting for concurrent callers")
+        time.sleep(0.001)
+
+
+@pytest.fixture
+def run_coalesced(monkeypatch):
+    """Run `call` from n threads against `flight`. The leader's work must block
+    on `release`; it is only set once the other n - 1 callers are waiting on the
+    leader's in-flight call, so the overlap does not depend on timing."""
+
+    def run(flight, n, call, release):
+        # feedback_std imports the helper as src.helpers.single_flight, a separate module
+        monkeypatch.setattr(sys.modules[type(flight).__module__], "_Call", _CountingCall)
+        results, errors = [], []
+
+        def target():
+            try:
+                results.append(call())
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=target) for _ in range(n)]
+        threads[0].start()
+        _wait_until(lambda: len(flight._calls) == 1)
+        (in_flight,) = flight._calls.values()
+
+        for t in threads[1:]:
+            t.start()
+        _wait_until(lambda: in_flight.done.waiting == n - 1)
+
+        release.set()
+        for t in threads:
+            t.join()
+        return results, errors
+
+    return run
+
+
+@pytest.fixture
+def wait_until():
+    return _wait_until
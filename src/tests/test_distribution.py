@@ -0,0 +1,28 @@
+import pytest
+
+from helpers.distribution import allocate_counts, type_counts
+
+
+@pytest.mark.parametrize("n", range(0, 23))
+def test_counts_sum_to_n(n):
+    assert sum(type_counts(n, 0.6, 0.2, 0.2).values()) == n
+
+
+def test_largest_remainder():
+    assert type_counts(7, 0.6, 0.2, 0.2) == {"MCQ": 4, "TrueFalse": 2, "Written": 1}
+
+
+def test_ties_go_to_earlier_keys():
+    assert allocate_counts(1, {"a": 1, "b": 1, "c": 1}) == {"a": 1, "b": 0, "c": 0}
+    assert allocate_counts(2, {"a": 1, "b": 1, "c": 1}) == {"a": 1, "b": 1, "c": 0}
+
+
+def test_none_and_zero_ratios():
+    assert type_counts(5, None, 0.5, 0.5) == {"MCQ": 0, "TrueFalse": 3, "Written": 2}
+    assert type_counts(4, 0, 0, 0) == {"MCQ": 0, "TrueFalse": 0, "Written": 0}
+    assert type_counts(None, 0.6, 0.2, 0.2) == {"MCQ": 0, "TrueFalse": 0, "Written": 0}
+
+
+def test_unnormalized_ratios_are_rescaled():
+    assert type_counts(9, 0.5, 0.2, 0.2) == {"MCQ": 5, "TrueFalse": 2, "Written": 2}
+    assert type_counts(10, 3, 1, 1) == type_counts(10, 0.6, 0.2, 0.2)
@@ -0,0 +1,54 @@
+import threading
+
+import pytest
+
+import src.models.feedback_std as feedback_std
+
+ANSWER = dict(question="ما هو التعلم الآلي؟", student_answer="لا أعرف", correct_answer="فرع من الذكاء الاصطناعي")
+
+
+@pytest.fixture
+def fake_grader(monkeypatch):
+    """Replace _grade_answer with a stub that records its arguments and blocks
+    until `release` is set."""
+    release = threading.Event()
+    graded = []
+
+    def fake_grade_answer(**params):
+        graded.append(params)
+        release.wait()
+        return {"feedback": "ok", "praise_points": [], "weak_points": [], "advice": ""}
+
+    monkeypatch.setattr(feedback_std, "_grade_answer", fake_grade_answer)
+    return graded, release
+
+
+def test_identical_answers_are_graded_once(fake_grader, run_coalesced, monkeypatch):
+    graded, release = fake_grader
+    monkeypatch.setattr(feedback_std, "COMPACT_PROMPTS", True)
+
+    results, errors = run_coalesced(
+        feedback_std._inflight, 4, lambda: feedback_std.grade_answer(**ANSWER), release
+    )
+
+    assert errors == []
+    assert len(graded) == 1
+    assert graded[0]["compact"] is True
+    assert all(r is results[0] for r in results)
+
+
+def test_compact_flag_is_part_of_the_key(fake_grader, wait_until, monkeypatch):
+    graded, release = fake_grader
+    threads = []
+
+    for compact in (False, True):
+        monkeypatch.setattr(feedback_std, "COMPACT_PROMPTS", compact)
+        t = threading.Thread(target=feedback_std.grade_answer, kwargs=ANSWER)
+        t.start()
+        threads.append(t)
+        wait_until(lambda: len(graded) == len(threads))
+
+    release.set()
+    for t in threads:
+        t.join()
+    assert [g["compact"] for g in graded] == [False, True]
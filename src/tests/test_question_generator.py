@@ -0,0 +1,105 @@
+import importlib
+import json
+
+import pytest
+
+from models.enums import QuestionTypeEnum
+
+MCQ = QuestionTypeEnum.MCQ.value
+TF = QuestionTypeEnum.TRUEFALSE.value
+WRITTEN = QuestionTypeEnum.WRITTEN.value
+
+
+def _item(qtype):
+    return {"type": qtype, "question": f"{qtype}?", "options": [], "answer": "x"}
+
+
+@pytest.fixture
+def make_generator(monkeypatch):
+    """Build a QuestionGenerator whose ollama.chat replies with the given quiz
+    pages in order (an empty quiz once they run out), recording every call."""
+    monkeypatch.setenv("QUIZ_GENERATION_MODEL", "test-model")
+    monkeypatch.setenv("EMBEDDING_MODEL", "test-embedding")
+    module = importlib.import_module("controller.QuestionGenerator")
+
+    def make(replies, **kwargs):
+        replies = list(replies)
+        chat_calls, page_counts = [], []
+
+        def fake_chat(**chat_kwargs):
+            chat_calls.append(chat_kwargs)
+            items = replies.pop(0) if replies else []
+            return {"message": {"content": json.dumps({"quiz": items})}}
+
+        monkeypatch.setattr(module.ollama, "chat", fake_chat)
+        generator = module.QuestionGenerator(**kwargs)
+
+        generate_page = generator._generate_page
+        def spy(level, page, counts):
+            page_counts.append(dict(counts))
+            return generate_page(level, page, counts)
+        monkeypatch.setattr(generator, "_generate_page", spy)
+
+        return generator, chat_calls, page_counts
+
+    return make
+
+
+def test_follow_up_only_for_short_type(make_generator):
+    generator, chat_calls, page_counts = make_generator([
+        [_item(MCQ)] * 3 + [_item(TF)],
+        [_item(WRITTEN)],
+    ])
+
+    quiz = generator.generate("easy", ["page"], n_questions=5)
+
+    assert len(chat_calls) == 2
+    assert page_counts == [
+        {MCQ: 3, TF: 1, WRITTEN: 1},
+        {MCQ: 0, TF: 0, WRITTEN: 1},
+    ]
+    assert len(quiz.questions) == 5
+
+
+def test_follow_ups_stop_after_max_followups(make_generator):
+    generator, chat_calls, page_counts = make_generator(
+        [[_item(MCQ)] * 3 + [_item(TF)]], max_followups=2
+    )
+
+    quiz = generator.generate("easy", ["page"], n_questions=5)
+
+    assert len(chat_calls) == 3
+    assert page_counts[1:] == [{MCQ: 0, TF: 0, WRITTEN: 1}] * 2
+    assert quiz.filter_by_type(WRITTEN) == []
+
+
+def test_type_labels_are_normalized(make_generator):
+    generator, chat_calls, _ = make_generator([[
+        _item("Multiple Choice"), _item(" mcq "), _item("اختيار من متعدد"),
+        _item("صح/خطأ"), _item("مقالية"),
+    ]])
+
+    quiz = generator.generate("easy", ["page"], n_questions=5)
+
+    assert len(chat_calls) == 1
+    assert len(quiz.filter_by_type(MCQ)) == 3
+    assert len(quiz.filter_by_type(TF)) == 1
+    assert len(quiz.filter_by_type(WRITTEN)) == 1
+
+
+def test_non_string_type_is_kept_as_is(make_generator):
+    generator, _, _ = make_generator([[_item(3)]], max_followups=0)
+
+    quiz = generator.generate("easy", ["page"], n_questions=1, mcq_ratio=1, tf_ratio=0, written_ratio=0)
+
+    assert [q.type for q in quiz.questions] == [3]
+
+
+@pytest.mark.parametrize("text_chunks, n_questions", [([], 5), (["page"], 0), (["page"], None)])
+def test_nothing_to_generate_makes_no_llm_calls(make_generator, text_chunks, n_questions):
+    generator, chat_calls, _ = make_generator([])
+
+    quiz = generator.generate("easy", text_chunks, n_questions=n_questions)
+
+    assert chat_calls == []
+    assert quiz.questions == []
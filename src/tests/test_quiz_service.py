@@ -0,0 +1,61 @@
+import threading
+
+import pytest
+
+import stores.llm.quiz_service as quiz_service
+
+PARAMS = dict(level="easy", focus_pages=[1, 2], remain_pages=[3], n_focus=4, n_remain=2)
+
+
+@pytest.fixture
+def fake_service(monkeypatch):
+    """Replace QuizService with a stub that records constructions and blocks
+    generate_quiz until `release` is set."""
+    release = threading.Event()
+    built = []
+
+    class FakeQuizService:
+        def __init__(self, pdf_path, model, language):
+            built.append((pdf_path, model, language))
+
+        def generate_quiz(self, **params):
+            release.wait()
+            return [{"pages": params["focus_pages"]}]
+
+    monkeypatch.setattr(quiz_service, "QuizService", FakeQuizService)
+    return built, release
+
+
+def test_identical_requests_build_one_service(fake_service, run_coalesced):
+    built, release = fake_service
+
+    results, errors = run_coalesced(
+        quiz_service._inflight, 5,
+        lambda: quiz_service.generate_quiz(pdf_path="a.pdf", language="ar", model="m", **PARAMS),
+        release
+    )
+
+    assert errors == []
+    assert built == [("a.pdf", "m", "ar")]
+    assert results == [[{"pages": [1, 2]}]] * 5
+
+
+def test_different_pages_are_not_coalesced(fake_service, wait_until):
+    built, release = fake_service
+    results = []
+
+    def request(focus_pages):
+        params = dict(PARAMS, focus_pages=focus_pages)
+        results.append(quiz_service.generate_quiz(pdf_path="a.pdf", language="ar", model="m", **params))
+
+    first = threading.Thread(target=request, args=([1, 2],))
+    second = threading.Thread(target=request, args=([2, 1],))
+    first.start()
+    wait_until(lambda: len(built) == 1)
+    second.start()
+    wait_until(lambda: len(built) == 2)
+
+    release.set()
+    first.join()
+    second.join()
+    assert sorted(r[0]["pages"] for r in results) == [[1, 2], [2, 1]]
@@ -0,0 +1,61 @@
+import threading
+
+import pytest
+
+from helpers.single_flight import SingleFlight, make_key
+
+
+def test_concurrent_callers_share_one_result(run_coalesced):
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def work():
+        calls.append(1)
+        release.wait()
+        return {"quiz": [1, 2, 3]}
+
+    results, errors = run_coalesced(flight, 5, lambda: flight.do("k", work), release)
+
+    assert errors == []
+    assert len(calls) == 1
+    assert len(results) == 5
+    assert all(r is results[0] for r in results)
+
+
+def test_error_propagates_to_followers(run_coalesced):
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def work():
+        calls.append(1)
+        release.wait()
+        raise ValueError("boom")
+
+    results, errors = run_coalesced(flight, 4, lambda: flight.do("k", work), release)
+
+    assert results == []
+    assert len(calls) == 1
+    assert len(errors) == 4
+    assert all(isinstance(e, ValueError) for e in errors)
+
+
+def test_key_is_released_after_call():
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flight.do("k", fail)
+
+    assert flight.do("k", lambda: 1) == 1
+    assert flight.do("k", lambda: 2) == 2
+    assert flight._calls == {}
+
+
+def test_make_key_is_canonical():
+    assert make_key("q", a=1, b=[1, 2]) == make_key("q", b=[1, 2], a=1)
+    assert make_key("q", a=1) != make_key("q", a=2)
+    assert make_key("q", pages=[1, 2]) != make_key("q", pages=[2, 1])
@@ -0,0 +1,39 @@
+import pytest
+
+from stores.llm.templates.locales.ar import prompt as ar_prompt
+from stores.llm.templates.locales.en import prompt as en_prompt
+from stores.llm.templates.template_parser import TemplateParser
+
+VARS = {"level": "easy", "text": "TEXT", "total_q": 5, "n_mcq": 3, "n_tf": 1, "n_written": 1}
+
+
+def test_compact_prefers_compact_template():
+    parser = TemplateParser("ar", compact=True)
+    assert parser.get("prompt", "quiz_prompt", VARS) == ar_prompt.quiz_prompt_compact.substitute(VARS)
+    assert parser.get("prompt", "system_prompt", VARS) == ar_prompt.system_prompt_compact.substitute(VARS)
+
+
+def test_verbose_ignores_compact_template():
+    parser = TemplateParser("ar")
+    assert parser.get("prompt", "quiz_prompt", VARS) == ar_prompt.quiz_prompt.substitute(VARS)
+
+
+def test_compact_falls_back_to_verbose_template():
+    parser = TemplateParser("en", compact=True)
+    assert parser.get("prompt", "quiz_prompt", VARS) == en_prompt.quiz_prompt.substitute(VARS)
+
+
+def test_missing_key_falls_back_to_default_language():
+    parser = TemplateParser("ar")
+    assert parser.get("prompt", "system_prompt", VARS) == en_prompt.system_prompt.substitute(VARS)
+
+
+def test_unknown_language_uses_default():
+    parser = TemplateParser("fr")
+    assert parser.get("prompt", "quiz_prompt", VARS) == en_prompt.quiz_prompt.substitute(VARS)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_missing_key_raises(compact):
+    with pytest.raises(KeyError):
+        TemplateParser("ar", compact=compact).get("prompt", "nope", VARS)